@@ -1 +1,194 @@
-"""The example sensor integration."""
+"""The FranklinWH integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry, ConfigEntryState
+from homeassistant.const import CONF_ID, CONF_NAME, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant, callback
+
+from .client import async_get_client, discard_client
+from .const import (
+    CONF_SWITCH_GROUPS,
+    DEFAULT_OPTIONS,
+    DOMAIN,
+    ENTITY_OPTIONS,
+    IMPORTED_SWITCH_GROUPS,
+    PLATFORMS,
+)
+from .coordinator import FranklinCoordinator, SwitchCoordinator
+from .meters import EnergyMeters
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class FranklinData:
+    """Runtime state of a config entry, kept across option changes."""
+
+    options: dict[str, Any]
+    coordinator: FranklinCoordinator
+    switch_coordinator: SwitchCoordinator
+
+
+def entry_options(entry: ConfigEntry) -> dict[str, Any]:
+    """Options for ``entry``, with defaults filled in."""
+    return {**DEFAULT_OPTIONS, **entry.options}
+
+
+def merge_options(
+    existing: Mapping[str, Any],
+    imported: Mapping[str, Any],
+    skip_groups: Collection[str] = (),
+) -> dict[str, Any]:
+    """Merge options imported from YAML into an entry's existing options.
+
+    Options already set on the entry win, so edits made in the UI survive a
+    restart with the YAML still present. Switch groups are combined by name,
+    since each YAML ``switch:`` block contributes one; groups named in
+    ``skip_groups`` were imported before and are left out, so deleting one in
+    the UI sticks.
+    """
+    merged = {**imported, **existing}
+    groups = list(existing.get(CONF_SWITCH_GROUPS, []))
+    names = {group[CONF_NAME] for group in groups}
+    groups += [
+        group
+        for group in imported.get(CONF_SWITCH_GROUPS, [])
+        if group[CONF_NAME] not in names and group[CONF_NAME] not in skip_groups
+    ]
+    if groups:
+        merged[CONF_SWITCH_GROUPS] = groups
+    return merged
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up FranklinWH from a config entry."""
+    client = await async_get_client(
+        hass, entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD], entry.data[CONF_ID]
+    )
+
+    # Pick up YAML imports queued before we started, and from here on let the
+    # update listener apply any that arrive while we are still setting up.
+    _async_apply_pending_imports(hass, entry)
+    options = entry_options(entry)
+    coordinator = FranklinCoordinator(hass, entry, client, options)
+    entry.runtime_data = FranklinData(
+        options, coordinator, SwitchCoordinator(hass, entry, client, options)
+    )
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    await coordinator.meters.async_load()
+    await coordinator.async_config_entry_first_refresh()
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry.
+
+    The shared client is left in place, so reloading the entry does not log
+    in again.
+    """
+    unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unloaded:
+        await entry.runtime_data.coordinator.meters.async_save()
+    return unloaded
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the shared client and stored meters when an entry is deleted."""
+    discard_client(
+        hass, entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD], entry.data[CONF_ID]
+    )
+    # Otherwise re-adding the gateway would resume the old periods and count
+    # everything since the removal into them.
+    await EnergyMeters(hass, entry.data[CONF_ID], []).async_remove()
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options without tearing down the connection."""
+    data: FranklinData = entry.runtime_data
+    options = entry_options(entry)
+    reload_entities = any(options[key] != data.options[key] for key in ENTITY_OPTIONS)
+    data.options = options
+
+    data.coordinator.apply_options(options)
+    data.switch_coordinator.apply_options(options)
+
+    if reload_entities and entry.state is not ConfigEntryState.LOADED:
+        # Still setting up, so the platforms may not be there to unload yet.
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+
+    if reload_entities:
+        _LOGGER.debug("FranklinWH entity options changed, reloading platforms")
+        await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # Refresh now so the new polling interval is scheduled straight away.
+    await data.coordinator.async_request_refresh()
+
+
+async def async_import_yaml(hass: HomeAssistant, import_data: dict[str, Any]) -> None:
+    """Import a YAML platform block into the config entry for its gateway.
+
+    The sensor and switch blocks for one gateway are imported concurrently at
+    startup. Each block's options are queued per gateway and only removed from
+    the queue once merged into the entry, and imports for a gateway run one at
+    a time, so no block is lost to another import or to entry setup.
+    """
+    gateway: str = import_data[CONF_ID]
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data.setdefault("pending_imports", {}).setdefault(gateway, []).append(
+        import_data["options"]
+    )
+    lock = domain_data.setdefault("import_locks", {}).setdefault(gateway, asyncio.Lock())
+
+    async with lock:
+        entry = hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, gateway)
+        if entry is None:
+            # Returns once the new entry is set up, which merges the queue.
+            await hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": SOURCE_IMPORT}, data=import_data
+            )
+            entry = hass.config_entries.async_entry_for_domain_unique_id(
+                DOMAIN, gateway
+            )
+        else:
+            # At startup, let the stored entry finish setting up first.
+            await hass.config_entries.async_wait_component(entry)
+
+        # If there is still no entry (e.g. the user is adding this gateway in
+        # the UI right now), the queue is merged when that entry is set up.
+        if entry is not None:
+            _async_apply_pending_imports(hass, entry)
+
+
+@callback
+def _async_apply_pending_imports(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Merge queued YAML imports for ``entry``'s gateway into its options."""
+    pending: dict[str, list[dict[str, Any]]] = hass.data.get(DOMAIN, {}).get(
+        "pending_imports", {}
+    )
+    imports = pending.pop(entry.data[CONF_ID], [])
+    if not imports:
+        return
+    options = dict(entry.options)
+    imported_groups = set(entry.data.get(IMPORTED_SWITCH_GROUPS, []))
+    for imported in imports:
+        options = merge_options(options, imported, imported_groups)
+        imported_groups.update(
+            group[CONF_NAME] for group in imported.get(CONF_SWITCH_GROUPS, [])
+        )
+    hass.config_entries.async_update_entry(
+        entry,
+        data={**entry.data, IMPORTED_SWITCH_GROUPS: sorted(imported_groups)},
+        options=options,
+    )
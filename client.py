@@ -0,0 +1,162 @@
+"""Shared FranklinWH client for the sensor and switch platforms."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any
+
+import franklinwh
+import httpx
+
+from homeassistant.const import (
+    MAJOR_VERSION as HASS_MAJOR_VERSION,
+    MINOR_VERSION as HASS_MINOR_VERSION,
+)
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SingleFlightClient:
+    """Wrap a ``franklinwh.Client`` so concurrent identical reads share a request.
+
+    A read issued while the same read is already in flight awaits the pending
+    request instead of starting another. A read may also pass ``freshness`` to
+    accept a result completed less than that many seconds ago; it is a
+    per-call argument because the client is shared between config entries
+    with their own reuse windows. Writes discard both, so a read after a
+    command always sees the new state.
+    """
+
+    def __init__(self, client: franklinwh.Client) -> None:
+        """Initializer."""
+        self.client = client
+        self._generation = 0
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._results: dict[str, tuple[float, Any]] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        """Pass anything we don't wrap through to the underlying client."""
+        return getattr(self.client, name)
+
+    async def get_stats(self, freshness: float = 0.0) -> franklinwh.Stats:
+        """Fetch the current stats."""
+        return await self._read("get_stats", freshness)
+
+    async def get_smart_switch_state(self, freshness: float = 0.0):
+        """Fetch the smart switch state."""
+        return await self._read("get_smart_switch_state", freshness)
+
+    async def set_smart_switch_state(self, state) -> None:
+        """Set the smart switch state."""
+        self.invalidate()
+        try:
+            await self.client.set_smart_switch_state(state)
+        finally:
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """Forget completed results and detach reads already in flight."""
+        self._generation += 1
+        self._inflight.clear()
+        self._results.clear()
+
+    async def _read(self, method: str, freshness: float) -> Any:
+        if freshness > 0 and method in self._results:
+            fetched_at, result = self._results[method]
+            if time.monotonic() - fetched_at < freshness:
+                return result
+
+        task = self._inflight.get(method)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(
+                self._fetch(method, self._generation)
+            )
+            self._inflight[method] = task
+        else:
+            _LOGGER.debug("Joining in-flight %s request", method)
+        # Shield the shared request so one caller being cancelled doesn't
+        # cancel it for everyone else waiting on it.
+        return await asyncio.shield(task)
+
+    async def _fetch(self, method: str, generation: int) -> Any:
+        try:
+            result = await getattr(self.client, method)()
+        finally:
+            if self._generation == generation:
+                self._inflight.pop(method, None)
+        if self._generation == generation:
+            self._results[method] = (time.monotonic(), result)
+        return result
+
+
+def supports_http2() -> bool:
+    if HASS_MAJOR_VERSION > 2026:
+        return True
+    elif HASS_MAJOR_VERSION == 2026 and HASS_MINOR_VERSION >= 2:
+        return True
+    return False
+
+
+async def async_create_client(
+    hass: HomeAssistant,
+    username: str,
+    password: str,
+    gateway: str,
+) -> franklinwh.Client:
+    """Create a new, unshared client for a gateway."""
+    fetcher = franklinwh.TokenFetcher(username, password)
+    if supports_http2():
+        # pylint: disable=no-name-in-module,import-outside-toplevel
+        from homeassistant.helpers.httpx_client import (  # noqa: PLC0415
+            SSL_ALPN_HTTP11_HTTP2,  # type: ignore  # noqa: PGH003
+            create_async_httpx_client,
+        )
+        # pylint: enable=no-name-in-module,import-outside-toplevel
+
+        def get_client() -> httpx.AsyncClient:
+            return create_async_httpx_client(hass, alpn_protocols=SSL_ALPN_HTTP11_HTTP2)
+
+        franklinwh.HttpClientFactory.set_client_factory(get_client)
+        return franklinwh.Client(fetcher, gateway)
+    return await hass.async_add_executor_job(franklinwh.Client, fetcher, gateway)
+
+
+async def async_get_client(
+    hass: HomeAssistant,
+    username: str,
+    password: str,
+    gateway: str,
+) -> SingleFlightClient:
+    """Return the shared client for a gateway, creating it on first use."""
+    clients = _clients(hass)
+    key = _client_key(username, password, gateway)
+
+    if key not in clients:
+        client = await async_create_client(hass, username, password, gateway)
+        # Another platform may have finished creating one while we waited.
+        clients.setdefault(key, SingleFlightClient(client))
+
+    return clients[key]
+
+
+def discard_client(
+    hass: HomeAssistant, username: str, password: str, gateway: str
+) -> None:
+    """Forget the shared client for a gateway, e.g. when its entry is removed."""
+    _clients(hass).pop(_client_key(username, password, gateway), None)
+
+
+def _client_key(username: str, password: str, gateway: str) -> tuple[str, str, str]:
+    # Key on the password too, so a client logged in with old credentials is
+    # never handed out for new ones. Only a digest of it is kept in memory.
+    return (username, hashlib.sha256(password.encode()).hexdigest(), gateway)
+
+
+def _clients(hass: HomeAssistant) -> dict[tuple[str, str, str], SingleFlightClient]:
+    return hass.data.setdefault(DOMAIN, {}).setdefault("clients", {})
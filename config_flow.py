@@ -0,0 +1,210 @@
+"""Config flow for FranklinWH."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+import franklinwh
+import httpx
+import voluptuous as vol
+
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import CONF_ID, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
+from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
+    ObjectSelector,
+    SelectSelector,
+    SelectSelectorConfig,
+    TextSelector,
+    TextSelectorConfig,
+    TextSelectorType,
+)
+
+from . import entry_options
+from .client import async_create_client
+from .const import (
+    CONF_DEDUPE_WINDOW,
+    CONF_HISTORY_SIZE,
+    CONF_METER_CYCLES,
+    CONF_OUTAGE_UPDATE_INTERVAL,
+    CONF_PREFIX,
+    CONF_SWITCH_GROUPS,
+    CONF_THRESHOLDS,
+    CONF_TOLERATE_STALE_DATA,
+    CONF_UPDATE_INTERVAL,
+    CONF_USE_SN,
+    DOMAIN,
+)
+from .events import THRESHOLD_SCHEMA
+from .meters import METER_CYCLES
+from .switch import SWITCH_GROUP_SCHEMA
+
+_LOGGER = logging.getLogger(__name__)
+
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): TextSelector(
+            TextSelectorConfig(type=TextSelectorType.EMAIL)
+        ),
+        vol.Required(CONF_PASSWORD): TextSelector(
+            TextSelectorConfig(type=TextSelectorType.PASSWORD)
+        ),
+        vol.Required(CONF_ID): TextSelector(),
+    }
+)
+
+
+def _seconds(minimum: float, maximum: float, step: float = 1) -> NumberSelector:
+    return NumberSelector(
+        NumberSelectorConfig(
+            min=minimum,
+            max=maximum,
+            step=step,
+            unit_of_measurement="s",
+            mode=NumberSelectorMode.BOX,
+        )
+    )
+
+
+class FranklinConfigFlow(ConfigFlow, domain=DOMAIN):
+    """Handle a config flow for FranklinWH."""
+
+    VERSION = 1
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return FranklinOptionsFlow()
+
+    async def async_step_user(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the initial step."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            gateway: str = user_input[CONF_ID]
+            await self.async_set_unique_id(gateway)
+            self._abort_if_unique_id_configured()
+
+            # Check the login on a fresh client rather than a shared one that
+            # may already be logged in with other credentials.
+            client = await async_create_client(
+                self.hass, user_input[CONF_USERNAME], user_input[CONF_PASSWORD], gateway
+            )
+            try:
+                await client.get_stats()
+            except franklinwh.client.InvalidCredentialsException:
+                errors["base"] = "invalid_auth"
+            except franklinwh.client.AccountLockedException:
+                errors["base"] = "account_locked"
+            except (
+                franklinwh.client.DeviceTimeoutException,
+                franklinwh.client.GatewayOfflineException,
+                httpx.HTTPError,
+            ):
+                errors["base"] = "cannot_connect"
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Unexpected error validating FranklinWH login")
+                errors["base"] = "unknown"
+            else:
+                return self.async_create_entry(title=gateway, data=user_input)
+
+        return self.async_show_form(
+            step_id="user",
+            data_schema=self.add_suggested_values_to_schema(USER_SCHEMA, user_input),
+            errors=errors,
+        )
+
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Import a YAML sensor or switch block.
+
+        Merging later blocks into the entry is left to ``async_import_yaml``.
+        """
+        gateway: str = import_data[CONF_ID]
+        await self.async_set_unique_id(gateway)
+        self._abort_if_unique_id_configured()
+
+        return self.async_create_entry(
+            title=gateway,
+            data={
+                CONF_USERNAME: import_data[CONF_USERNAME],
+                CONF_PASSWORD: import_data[CONF_PASSWORD],
+                CONF_ID: gateway,
+            },
+            options=import_data["options"],
+        )
+
+
+class FranklinOptionsFlow(OptionsFlow):
+    """Change the polling, stale data and entity options of a running entry."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            options = dict(user_input)
+            options[CONF_UPDATE_INTERVAL] = int(options[CONF_UPDATE_INTERVAL])
+            options[CONF_OUTAGE_UPDATE_INTERVAL] = int(
+                options[CONF_OUTAGE_UPDATE_INTERVAL]
+            )
+            options[CONF_HISTORY_SIZE] = int(options[CONF_HISTORY_SIZE])
+            try:
+                options[CONF_THRESHOLDS] = vol.Schema([THRESHOLD_SCHEMA])(
+                    options.get(CONF_THRESHOLDS) or []
+                )
+            except vol.Invalid:
+                errors[CONF_THRESHOLDS] = "invalid_thresholds"
+            try:
+                options[CONF_SWITCH_GROUPS] = vol.Schema([SWITCH_GROUP_SCHEMA])(
+                    options.get(CONF_SWITCH_GROUPS) or []
+                )
+            except vol.Invalid:
+                errors[CONF_SWITCH_GROUPS] = "invalid_switch_groups"
+            if not errors:
+                return self.async_create_entry(data=options)
+
+        options = entry_options(self.config_entry)
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_UPDATE_INTERVAL): _seconds(5, 3600),
+                vol.Required(CONF_OUTAGE_UPDATE_INTERVAL): _seconds(0, 3600),
+                vol.Required(CONF_TOLERATE_STALE_DATA): BooleanSelector(),
+                vol.Required(CONF_DEDUPE_WINDOW): _seconds(0, 60, 0.1),
+                vol.Required(CONF_PREFIX): TextSelector(),
+                vol.Required(CONF_USE_SN): BooleanSelector(),
+                vol.Required(CONF_HISTORY_SIZE): NumberSelector(
+                    NumberSelectorConfig(
+                        min=2, max=10000, step=1, mode=NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Required(CONF_METER_CYCLES): SelectSelector(
+                    SelectSelectorConfig(
+                        options=list(METER_CYCLES),
+                        multiple=True,
+                        translation_key=CONF_METER_CYCLES,
+                    )
+                ),
+                vol.Optional(CONF_THRESHOLDS): ObjectSelector(),
+                vol.Optional(CONF_SWITCH_GROUPS): ObjectSelector(),
+            }
+        )
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                schema, user_input or options
+            ),
+            errors=errors,
+        )
@@ -0,0 +1,45 @@
+"""Constants for the FranklinWH integration."""
+
+from homeassistant.const import Platform
+
+DOMAIN = "franklin_wh"
+PLATFORMS = [Platform.SENSOR, Platform.SWITCH]
+
+CONF_UPDATE_INTERVAL = "update_interval"
+CONF_OUTAGE_UPDATE_INTERVAL = "outage_update_interval"
+CONF_TOLERATE_STALE_DATA = "tolerate_stale_data"
+CONF_DEDUPE_WINDOW = "dedupe_window"
+CONF_USE_SN = "use_sn"
+CONF_PREFIX = "prefix"
+CONF_HISTORY_SIZE = "history_size"
+CONF_METER_CYCLES = "meter_cycles"
+CONF_THRESHOLDS = "thresholds"
+CONF_SWITCH_GROUPS = "switch_groups"
+
+DEFAULT_UPDATE_INTERVAL = 30
+DEFAULT_DEDUPE_WINDOW = 0
+DEFAULT_HISTORY_SIZE = 120
+DEFAULT_PREFIX = "FranklinWH"
+
+# Intervals are stored in seconds so the options stay JSON serialisable. An
+# outage interval of 0 means "same as update_interval".
+DEFAULT_OPTIONS = {
+    CONF_UPDATE_INTERVAL: DEFAULT_UPDATE_INTERVAL,
+    CONF_OUTAGE_UPDATE_INTERVAL: 0,
+    CONF_TOLERATE_STALE_DATA: False,
+    CONF_DEDUPE_WINDOW: DEFAULT_DEDUPE_WINDOW,
+    CONF_USE_SN: False,
+    CONF_PREFIX: DEFAULT_PREFIX,
+    CONF_HISTORY_SIZE: DEFAULT_HISTORY_SIZE,
+    CONF_METER_CYCLES: [],
+    CONF_THRESHOLDS: [],
+    CONF_SWITCH_GROUPS: [],
+}
+
+# Entry data key listing the YAML switch groups already imported, so a group
+# deleted in the options flow is not imported again on the next start.
+IMPORTED_SWITCH_GROUPS = "imported_switch_groups"
+
+# Options that change which entities exist or how they are named. Changing
+# any of these reloads the platforms; everything else is applied in place.
+ENTITY_OPTIONS = (CONF_USE_SN, CONF_PREFIX, CONF_METER_CYCLES, CONF_SWITCH_GROUPS)
@@ -0,0 +1,220 @@
+"""Data update coordinators for FranklinWH."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from datetime import timedelta
+import logging
+import time
+from typing import Any
+
+import franklinwh
+import httpx
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .client import SingleFlightClient
+from .const import (
+    CONF_DEDUPE_WINDOW,
+    CONF_HISTORY_SIZE,
+    CONF_METER_CYCLES,
+    CONF_OUTAGE_UPDATE_INTERVAL,
+    CONF_THRESHOLDS,
+    CONF_TOLERATE_STALE_DATA,
+    CONF_UPDATE_INTERVAL,
+)
+from .events import StatsWatcher, thresholds_from_config
+from .history import SampleRing
+from .meters import EnergyMeters
+
+_LOGGER = logging.getLogger(__name__)
+
+# Only the fields the trend sensors read, to keep the ring small.
+HISTORY_FIELDS = (
+    "battery_soc",
+    "home_load",
+)
+
+
+class StaleDataCache:
+    """Cache data fetch."""
+
+    def __init__(self) -> None:
+        """Empty cache."""
+        self.last_data: franklinwh.Stats | None = None
+
+    def store(self, data: franklinwh.Stats) -> None:
+        """Cache data fetch."""
+        self.last_data = data
+
+    def is_populated(self) -> bool:
+        """Is cache populated?"""
+        return self.last_data is not None
+
+    def data(self) -> franklinwh.Stats:
+        """Retrieve cached data."""
+        assert self.last_data is not None, "Cache is not populated"
+        return self.last_data
+
+
+class FranklinCoordinator(DataUpdateCoordinator[franklinwh.Stats]):
+    """Fetch stats, and keep the history, events and meters derived from them.
+
+    Options are applied in place by ``apply_options``, so changing them never
+    drops the client, the stale data cache or the sample history.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        client: SingleFlightClient,
+        options: Mapping[str, Any],
+    ) -> None:
+        """Initializer."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=config_entry,
+            name="franklinwh",
+            update_interval=timedelta(seconds=options[CONF_UPDATE_INTERVAL]),
+            always_update=False,
+        )
+        gateway: str = config_entry.data[CONF_ID]
+        self.client = client
+        self.cache = StaleDataCache()
+        self.history = SampleRing(HISTORY_FIELDS, options[CONF_HISTORY_SIZE])
+        self.watcher = StatsWatcher(hass, gateway, [])
+        self.meters = EnergyMeters(hass, gateway, [])
+        self.apply_options(options)
+
+    def apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed options to the running coordinator."""
+        self.normal_update_interval = timedelta(seconds=options[CONF_UPDATE_INTERVAL])
+        self.outage_update_interval = (
+            timedelta(seconds=options[CONF_OUTAGE_UPDATE_INTERVAL])
+            if options[CONF_OUTAGE_UPDATE_INTERVAL]
+            else None
+        )
+        self.tolerate_stale_data: bool = options[CONF_TOLERATE_STALE_DATA]
+        self.dedupe_window: float = options[CONF_DEDUPE_WINDOW]
+        if options[CONF_HISTORY_SIZE] != self.history.capacity:
+            self.history = self.history.resized(options[CONF_HISTORY_SIZE])
+        self.watcher.thresholds = thresholds_from_config(
+            options[CONF_THRESHOLDS], self.watcher.thresholds
+        )
+        self.meters.cycles = list(options[CONF_METER_CYCLES])
+        self._apply_update_interval()
+
+    def _apply_update_interval(self) -> None:
+        # Poll faster while off-grid so automations react quickly.
+        if self.outage_update_interval is not None and not self.watcher.grid_normal:
+            self.update_interval = self.outage_update_interval
+        else:
+            self.update_interval = self.normal_update_interval
+
+    async def _async_update_data(self) -> franklinwh.Stats:
+        max_retries = 3
+        retry_delay = 2  # seconds
+
+        _LOGGER.debug("Fetching latest data from FranklinWH")
+        for attempt in range(max_retries):
+            if attempt > 0:
+                _LOGGER.warning("Trying again")
+                await asyncio.sleep(retry_delay)
+            try:
+                data = await self.client.get_stats(self.dedupe_window)
+            except franklinwh.client.DeviceTimeoutException as e:
+                _LOGGER.warning(
+                    "Error getting data from FranklinWH - Device Timeout: %s", e
+                )
+            except franklinwh.client.GatewayOfflineException as e:
+                _LOGGER.warning(
+                    "Error getting data from FranklinWH - Gateway Offline %s", e
+                )
+            except franklinwh.client.AccountLockedException as e:
+                _LOGGER.warning(
+                    "Error getting data from FranklinWH - Account Locked %s", e
+                )
+            except franklinwh.client.InvalidCredentialsException as e:
+                _LOGGER.warning(
+                    "Error getting data from FranklinWH - Invalid Credentials %s", e
+                )
+            except franklinwh.client.InvalidDataException as e:
+                _LOGGER.warning(
+                    "Error getting data from FranklinWH - Invalid Body Returned %s", e
+                )
+            except httpx.ReadTimeout as e:
+                _LOGGER.warning(
+                    "Timeout fetching data from FranklinWH: %s", e
+                )
+            else:
+                if attempt > 0:
+                    _LOGGER.warning(
+                        "Successfully fetched data from FranklinWH after retry"
+                    )
+                else:
+                    _LOGGER.debug("Fetched latest data from FranklinWH: %s", data)
+                self.cache.store(data)
+                self.history.append(time.monotonic(), data.current)
+                self.watcher.observe(data)
+                self.meters.update(data.totals)
+                self._apply_update_interval()
+                return data
+
+        _LOGGER.warning(
+            "Failed to fetch data from FranklinWH after %s attempts", max_retries
+        )
+
+        if self.tolerate_stale_data and self.cache.is_populated():
+            return self.cache.data()
+
+        raise UpdateFailed(
+            f"Failed to fetch data from FranklinWH after {max_retries} attempts."
+        )
+
+
+class SwitchCoordinator(DataUpdateCoordinator):
+    """Fetch the smart switch state, shared by every switch group."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        client: SingleFlightClient,
+        options: Mapping[str, Any],
+    ) -> None:
+        """Initializer."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=config_entry,
+            name="franklinwh",
+            update_interval=timedelta(seconds=options[CONF_UPDATE_INTERVAL]),
+            always_update=False,
+        )
+        self.client = client
+        self.apply_options(options)
+
+    def apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply changed options to the running coordinator."""
+        self.update_interval = timedelta(seconds=options[CONF_UPDATE_INTERVAL])
+        self.dedupe_window: float = options[CONF_DEDUPE_WINDOW]
+
+    async def _async_update_data(self):
+        _LOGGER.debug("Fetching latest switch data from FranklinWH...")
+        try:
+            return await self.client.get_smart_switch_state(self.dedupe_window)
+
+        except franklinwh.client.DeviceTimeoutException as e:
+            _LOGGER.warning("Error getting data from FranklinWH - Device Timeout: %s", e)
+        except franklinwh.client.GatewayOfflineException as e:
+            _LOGGER.warning("Error getting data from FranklinWH - Gateway Offline %s", e)
+        except franklinwh.client.AccountLockedException as e:
+            _LOGGER.warning("Error getting data from FranklinWH - Account Locked %s", e)
+        except franklinwh.client.InvalidCredentialsException as e:
+            _LOGGER.warning("Error getting data from FranklinWH - Invalid Credentials %s", e)
@@ -0,0 +1,137 @@
+"""Events fired on changes between consecutive FranklinWH snapshots."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+
+import franklinwh
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_GRID_STATUS = "franklin_wh_grid_status"
+EVENT_THRESHOLD = "franklin_wh_threshold"
+
+THRESHOLD_FIELDS = (
+    "battery_soc",
+    "battery_use",
+    "home_load",
+    "grid_use",
+    "solar_production",
+    "generator_production",
+    "switch_1_load",
+    "switch_2_load",
+    "v2l_use",
+)
+
+THRESHOLD_SCHEMA = vol.Schema(
+    {
+        vol.Required("field"): vol.In(THRESHOLD_FIELDS),
+        vol.Required("value"): vol.Coerce(float),
+        vol.Optional("hysteresis", default=0.0): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+
+@dataclass
+class Threshold:
+    """A level on one ``Stats.current`` field to report crossings of.
+
+    The value is considered to have dropped below the threshold once it is
+    under ``value``, and to have risen above it again once it reaches
+    ``value + hysteresis``, so noise around the level does not flap. A first
+    reading inside that band counts as above, so the next drop is reported.
+    """
+
+    field: str
+    value: float
+    hysteresis: float = 0.0
+    below: bool | None = None
+
+    def update(self, reading: float) -> bool:
+        """Track ``reading``, returning True if it crossed the threshold."""
+        if reading < self.value:
+            below = True
+        elif reading >= self.value + self.hysteresis:
+            below = False
+        else:
+            below = self.below if self.below is not None else False
+        crossed = self.below is not None and below != self.below
+        self.below = below
+        return crossed
+
+
+class StatsWatcher:
+    """Diff consecutive snapshots and fire events on transitions."""
+
+    def __init__(
+        self, hass: HomeAssistant, gateway: str, thresholds: list[Threshold]
+    ) -> None:
+        """Initializer."""
+        self.hass = hass
+        self.gateway = gateway
+        self.thresholds = thresholds
+        self.grid_status: franklinwh.GridStatus | None = None
+
+    @property
+    def grid_normal(self) -> bool:
+        """Is the grid connected, as of the last snapshot?"""
+        return self.grid_status in (None, franklinwh.GridStatus.NORMAL)
+
+    def observe(self, stats: franklinwh.Stats) -> None:
+        """Compare ``stats`` against the previous snapshot."""
+        current = stats.current
+        status = current.grid_status
+        if self.grid_status is not None and status != self.grid_status:
+            _LOGGER.info(
+                "FranklinWH grid status changed from %s to %s",
+                self.grid_status.name,
+                status.name,
+            )
+            self.hass.bus.async_fire(
+                EVENT_GRID_STATUS,
+                {
+                    "gateway": self.gateway,
+                    "from": self.grid_status.name,
+                    "to": status.name,
+                },
+            )
+        self.grid_status = status
+
+        for threshold in self.thresholds:
+            reading = getattr(current, threshold.field)
+            if reading is None or not threshold.update(reading):
+                continue
+            self.hass.bus.async_fire(
+                EVENT_THRESHOLD,
+                {
+                    "gateway": self.gateway,
+                    "field": threshold.field,
+                    "threshold": threshold.value,
+                    "value": reading,
+                    "direction": "below" if threshold.below else "above",
+                },
+            )
+
+
+def thresholds_from_config(
+    config: list[dict], existing: list[Threshold] | None = None
+) -> list[Threshold]:
+    """Build thresholds from validated ``THRESHOLD_SCHEMA`` entries.
+
+    Thresholds in ``existing`` with the same field, value and hysteresis are
+    kept as they are, so their above/below state carries over.
+    """
+    current = {(t.field, t.value, t.hysteresis): t for t in existing or []}
+    return [
+        current.get(
+            (item["field"], item["value"], item["hysteresis"]),
+            Threshold(item["field"], item["value"], item["hysteresis"]),
+        )
+        for item in config
+    ]
@@ -0,0 +1,127 @@
+"""Bounded in-memory history of recent FranklinWH samples."""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Iterable
+from typing import Any
+
+
+class SampleRing:
+    """Fixed-size ring of recent ``Stats.current`` samples.
+
+    Samples are stored column-wise in preallocated ``array("d")`` buffers, so
+    memory stays bounded by ``capacity`` no matter how often we poll. The
+    regression sums and running maxima behind the trend queries are updated as
+    samples enter and leave the ring, so queries never rescan the buffer.
+    """
+
+    def __init__(self, fields: Iterable[str], capacity: int) -> None:
+        """Allocate an empty ring."""
+        if capacity < 2:
+            raise ValueError("SampleRing capacity must be at least 2")
+        self.capacity = capacity
+        self.fields = tuple(fields)
+        self._count = 0
+        self._origin = 0.0
+        self._times = array("d", [0.0]) * capacity
+        self._columns = {field: array("d", [0.0]) * capacity for field in self.fields}
+        self._sum_t = 0.0
+        self._sum_tt = 0.0
+        self._sum_v = dict.fromkeys(self.fields, 0.0)
+        self._sum_tv = dict.fromkeys(self.fields, 0.0)
+        # Sequence numbers of samples in decreasing value order (sliding max).
+        self._peaks: dict[str, deque[int]] = {field: deque() for field in self.fields}
+
+    def __len__(self) -> int:
+        """Number of samples currently held."""
+        return min(self._count, self.capacity)
+
+    def append(self, timestamp: float, sample: Any) -> None:
+        """Record the tracked fields of ``sample``, evicting the oldest if full."""
+        self._push(timestamp, [float(getattr(sample, field)) for field in self.fields])
+
+    def resized(self, capacity: int) -> SampleRing:
+        """Copy of this ring with a new capacity, keeping the newest samples."""
+        ring = SampleRing(self.fields, capacity)
+        columns = list(self._columns.values())
+        for seq in range(self._count - min(capacity, len(self)), self._count):
+            slot = seq % self.capacity
+            ring._push(
+                self._origin + self._times[slot], [column[slot] for column in columns]
+            )
+        return ring
+
+    def _push(self, timestamp: float, values: list[float]) -> None:
+        slot = self._count % self.capacity
+        if self._count >= self.capacity:
+            self._evict(slot)
+
+        t = timestamp - self._origin
+        self._times[slot] = t
+        self._sum_t += t
+        self._sum_tt += t * t
+        for (field, column), value in zip(self._columns.items(), values):
+            column[slot] = value
+            self._sum_v[field] += value
+            self._sum_tv[field] += t * value
+            peaks = self._peaks[field]
+            while peaks and column[peaks[-1] % self.capacity] <= value:
+                peaks.pop()
+            peaks.append(self._count)
+
+        self._count += 1
+        if self._count % self.capacity == 0:
+            self._rebase()
+
+    def latest(self, field: str) -> float | None:
+        """Most recent value of ``field``."""
+        if not self._count:
+            return None
+        return self._columns[field][(self._count - 1) % self.capacity]
+
+    def peak(self, field: str) -> float | None:
+        """Largest value of ``field`` currently held."""
+        peaks = self._peaks[field]
+        if not peaks:
+            return None
+        return self._columns[field][peaks[0] % self.capacity]
+
+    def slope(self, field: str) -> float | None:
+        """Least-squares rate of change of ``field``, in units per second."""
+        n = len(self)
+        denominator = n * self._sum_tt - self._sum_t * self._sum_t
+        if n < 2 or denominator <= 0:
+            return None
+        return (
+            n * self._sum_tv[field] - self._sum_t * self._sum_v[field]
+        ) / denominator
+
+    def _evict(self, slot: int) -> None:
+        t = self._times[slot]
+        self._sum_t -= t
+        self._sum_tt -= t * t
+        expired = self._count - self.capacity
+        for field, column in self._columns.items():
+            value = column[slot]
+            self._sum_v[field] -= value
+            self._sum_tv[field] -= t * value
+            peaks = self._peaks[field]
+            if peaks and peaks[0] <= expired:
+                peaks.popleft()
+
+    def _rebase(self) -> None:
+        # Called whenever the ring wraps: shift times so the oldest sample is
+        # at zero and recompute the sums, which keeps rounding error from the
+        # incremental updates from accumulating.
+        oldest = self._times[self._count % self.capacity]
+        self._origin += oldest
+        times = self._times
+        for i in range(self.capacity):
+            times[i] -= oldest
+        self._sum_t = sum(times)
+        self._sum_tt = sum(t * t for t in times)
+        for field, column in self._columns.items():
+            self._sum_v[field] = sum(column)
+            self._sum_tv[field] = sum(t * v for t, v in zip(times, column))
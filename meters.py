@@ -0,0 +1,153 @@
+"""Period energy meters accumulated from FranklinWH totals."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 60  # seconds
+
+METER_CYCLES = ("daily", "weekly", "monthly", "yearly")
+
+# Stats.totals attribute -> entity name suffix.
+METER_FIELDS = {
+    "grid_import": "grid_import",
+    "grid_export": "grid_export",
+    "solar": "solar_energy",
+    "home_use": "home_use",
+    "battery_charge": "battery_charge",
+    "battery_discharge": "battery_discharge",
+}
+
+
+def period_start(cycle: str, now: datetime) -> datetime:
+    """Start of the ``cycle`` period containing ``now``, in local time."""
+    now = dt_util.as_local(now)
+    if cycle == "daily":
+        day = now
+    elif cycle == "weekly":
+        day = now - timedelta(days=now.weekday())
+    elif cycle == "monthly":
+        day = now.replace(day=1)
+    elif cycle == "yearly":
+        day = now.replace(month=1, day=1)
+    else:
+        raise ValueError(f"Unknown meter cycle {cycle}")
+    return dt_util.start_of_local_day(day)
+
+
+@dataclass
+class Period:
+    """Energy accumulated per field since ``start``."""
+
+    start: datetime
+    values: dict[str, float] = field(default_factory=dict)
+
+
+class EnergyMeters:
+    """Accumulate the cloud totals into resetting per-period counters.
+
+    Only the difference between consecutive totals is counted, so the meters
+    follow the FranklinWH totals whether those are lifetime or reset daily. A
+    total that goes down is treated as having been reset, as with
+    ``utility_meter``.
+    """
+
+    def __init__(self, hass: HomeAssistant, gateway: str, cycles: list[str]) -> None:
+        """Initializer."""
+        self.cycles = cycles
+        self.last_totals: dict[str, float] = {}
+        self.periods: dict[str, Period] = {}
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.meters.{gateway}"
+        )
+
+    async def async_load(self) -> None:
+        """Restore the meters from storage.
+
+        Only the periods that were running when the meters were saved are
+        restored, so the stored totals are a valid baseline for exactly those.
+        """
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        self.last_totals = stored.get("totals", {})
+        for cycle, period in stored.get("periods", {}).items():
+            start = dt_util.parse_datetime(period["start"])
+            if start is not None:
+                self.periods[cycle] = Period(start, period["values"])
+
+    async def async_save(self) -> None:
+        """Write the meters to storage now."""
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the stored meters, e.g. when the gateway's entry is removed."""
+        await self._store.async_remove()
+
+    def update(self, totals: Any, now: datetime | None = None) -> None:
+        """Add the change in ``totals`` since the last update.
+
+        The totals are tracked even with no cycles enabled, and a cycle that
+        was not running on the previous update starts counting from this
+        reading, so enabling it later never counts the energy from while it
+        was off.
+        """
+        now = now or dt_util.now()
+
+        periods: dict[str, Period] = {}
+        for cycle in self.cycles:
+            start = period_start(cycle, now)
+            period = self.periods.get(cycle)
+            if period is None or period.start != start:
+                _LOGGER.debug("Starting new %s energy meter period at %s", cycle, start)
+                period = Period(start)
+            periods[cycle] = period
+        running = [period for cycle, period in periods.items() if cycle in self.periods]
+        self.periods = periods
+
+        for attr in METER_FIELDS:
+            total = getattr(totals, attr)
+            if total is None:
+                continue
+            last = self.last_totals.get(attr)
+            self.last_totals[attr] = total
+            if last is None:
+                continue
+            delta = total - last if total >= last else total
+            for period in running:
+                period.values[attr] = period.values.get(attr, 0.0) + delta
+
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def value(self, cycle: str, attr: str) -> float | None:
+        """Energy accumulated for ``attr`` in the current ``cycle`` period."""
+        period = self.periods.get(cycle)
+        if period is None:
+            return None
+        return period.values.get(attr, 0.0)
+
+    def last_reset(self, cycle: str) -> datetime | None:
+        """When the current ``cycle`` period started."""
+        period = self.periods.get(cycle)
+        return period.start if period else None
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {
+            "totals": self.last_totals,
+            "periods": {
+                cycle: {"start": period.start.isoformat(), "values": period.values}
+                for cycle, period in self.periods.items()
+            },
+        }
@@ -2,12 +2,9 @@
 
 from __future__ import annotations
 
-import asyncio
-from datetime import timedelta
 import logging
 
 import franklinwh
-import httpx
 import voluptuous as vol
 
 from homeassistant.components.sensor import (
@@ -16,29 +13,44 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     CONF_ID,
     CONF_PASSWORD,
     CONF_USERNAME,
-    MAJOR_VERSION as HASS_MAJOR_VERSION,
-    MINOR_VERSION as HASS_MINOR_VERSION,
     PERCENTAGE,
     UnitOfEnergy,
     UnitOfPower,
+    UnitOfTime,
     __short_version__,
 )
 from homeassistant.core import HomeAssistant
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import async_import_yaml
+from .const import (
+    CONF_DEDUPE_WINDOW,
+    CONF_HISTORY_SIZE,
+    CONF_METER_CYCLES,
+    CONF_OUTAGE_UPDATE_INTERVAL,
+    CONF_PREFIX,
+    CONF_THRESHOLDS,
+    CONF_TOLERATE_STALE_DATA,
+    CONF_UPDATE_INTERVAL,
+    CONF_USE_SN,
+    DEFAULT_DEDUPE_WINDOW,
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_PREFIX,
+    DEFAULT_UPDATE_INTERVAL,
 )
+from .coordinator import FranklinCoordinator
+from .events import THRESHOLD_SCHEMA
+from .meters import METER_CYCLES, METER_FIELDS
 
 _LOGGER = logging.getLogger(__name__)
-DEFAULT_UPDATE_INTERVAL = 30
 
 PLATFORM_SCHEMA = SENSOR_PLATFORM_SCHEMA.extend(
     {
@@ -51,149 +63,80 @@ PLATFORM_SCHEMA = SENSOR_PLATFORM_SCHEMA.extend(
             "update_interval", default=DEFAULT_UPDATE_INTERVAL
         ): cv.time_period,
         vol.Optional("tolerate_stale_data", default=False): cv.boolean,
+        vol.Optional("history_size", default=DEFAULT_HISTORY_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=2)
+        ),
+        vol.Optional("thresholds", default=[]): vol.All(
+            cv.ensure_list, [THRESHOLD_SCHEMA]
+        ),
+        vol.Optional("outage_update_interval"): cv.time_period,
+        vol.Optional(
+            "dedupe_window", default=DEFAULT_DEDUPE_WINDOW
+        ): cv.time_period,
+        vol.Optional("meter_cycles", default=[]): vol.All(
+            cv.ensure_list, [vol.In(METER_CYCLES)]
+        ),
     }
 )
 
 
-class StaleDataCache:
-    """Cache data fetch."""
-
-    def __init__(self) -> None:
-        """Empty cache."""
-        self.last_data: franklinwh.Stats | None = None
-
-    def store(self, data: franklinwh.Stats) -> None:
-        """Cache data fetch."""
-        self.last_data = data
-
-    def is_populated(self) -> bool:
-        """Is cache populated?"""
-        return self.last_data is not None
-
-    def data(self) -> franklinwh.Stats:
-        """Retrieve cached data."""
-        assert self.last_data is not None, "Cache is not populated"
-        return self.last_data
-
-def supports_http2() -> bool:
-    if HASS_MAJOR_VERSION > 2026:
-        return True
-    elif HASS_MAJOR_VERSION == 2026 and HASS_MINOR_VERSION >= 2:
-        return True
-    return False
-
-
 async def async_setup_platform(
     hass: HomeAssistant,
     config: ConfigType,
     async_add_entities: AddEntitiesCallback,
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
-    """Set up the sensor platform."""
-    username: str = config[CONF_USERNAME]
-    password: str = config[CONF_PASSWORD]
-    gateway: str = config[CONF_ID]
-    update_interval: timedelta = config["update_interval"]
-
-    # TODO(richo) why does it string the default value
-    if config["use_sn"] and config["use_sn"] != "False":
-        unique_id = gateway
-    else:
-        unique_id = None
+    """Import a YAML sensor platform into a config entry."""
+    _LOGGER.warning(
+        "Configuring FranklinWH sensors in YAML is deprecated. Your configuration"
+        " has been imported; remove the franklin_wh sensor platform from"
+        " configuration.yaml and manage it under Settings -> Devices & Services"
+    )
 
     # TODO(richo) why does it string the default value
+    use_sn = bool(config["use_sn"] and config["use_sn"] != "False")
     if config["prefix"] and config["prefix"] != "False":
         prefix = config["prefix"]
     else:
-        prefix = "FranklinWH"
-
-    fetcher = franklinwh.TokenFetcher(username, password)
-    if supports_http2():
-        # pylint: disable=no-name-in-module,import-outside-toplevel
-        from homeassistant.helpers.httpx_client import (  # noqa: PLC0415
-            SSL_ALPN_HTTP11_HTTP2,  # type: ignore  # noqa: PGH003
-            create_async_httpx_client,
-        )
-        # pylint: enable=no-name-in-module,import-outside-toplevel
-
-        def get_client() -> httpx.AsyncClient:
-            return create_async_httpx_client(hass, alpn_protocols=SSL_ALPN_HTTP11_HTTP2)
-
-        franklinwh.HttpClientFactory.set_client_factory(get_client)
-        client = franklinwh.Client(fetcher, gateway)
-    else:
-        client = await hass.async_add_executor_job(franklinwh.Client, fetcher, gateway)
-
-    cache = StaleDataCache()
-
-    async def _update_data() -> franklinwh.Stats:
-        max_retries = 3
-        retry_delay = 2  # seconds
-
-        _LOGGER.debug("Fetching latest data from FranklinWH")
-        for attempt in range(max_retries):
-            if attempt > 0:
-                _LOGGER.warning("Trying again")
-                await asyncio.sleep(retry_delay)
-            try:
-                data = await client.get_stats()
-            except franklinwh.client.DeviceTimeoutException as e:
-                _LOGGER.warning(
-                    "Error getting data from FranklinWH - Device Timeout: %s", e
-                )
-            except franklinwh.client.GatewayOfflineException as e:
-                _LOGGER.warning(
-                    "Error getting data from FranklinWH - Gateway Offline %s", e
-                )
-            except franklinwh.client.AccountLockedException as e:
-                _LOGGER.warning(
-                    "Error getting data from FranklinWH - Account Locked %s", e
-                )
-            except franklinwh.client.InvalidCredentialsException as e:
-                _LOGGER.warning(
-                    "Error getting data from FranklinWH - Invalid Credentials %s", e
-                )
-            except franklinwh.client.InvalidDataException as e:
-                _LOGGER.warning(
-                    "Error getting data from FranklinWH - Invalid Body Returned %s", e
-                )
-            except httpx.ReadTimeout as e:
-                _LOGGER.warning(
-                    "Timeout fetching data from FranklinWH: %s", e
-                )
-            else:
-                if attempt > 0:
-                    _LOGGER.warning(
-                        "Successfully fetched data from FranklinWH after retry"
-                    )
-                else:
-                    _LOGGER.debug("Fetched latest data from FranklinWH: %s", data)
-                cache.store(data)
-                return data
-
-        _LOGGER.warning(
-            "Failed to fetch data from FranklinWH after %s attempts", max_retries
-        )
-
-        if config["tolerate_stale_data"] and cache.is_populated():
-            return cache.data()
-
-        raise UpdateFailed(
-            f"Failed to fetch data from FranklinWH after {max_retries} attempts."
+        prefix = DEFAULT_PREFIX
+
+    outage_update_interval = config.get("outage_update_interval")
+    options = {
+        CONF_UPDATE_INTERVAL: int(config["update_interval"].total_seconds()),
+        CONF_OUTAGE_UPDATE_INTERVAL: int(outage_update_interval.total_seconds())
+        if outage_update_interval
+        else 0,
+        CONF_TOLERATE_STALE_DATA: config["tolerate_stale_data"],
+        CONF_DEDUPE_WINDOW: config["dedupe_window"].total_seconds(),
+        CONF_USE_SN: use_sn,
+        CONF_PREFIX: prefix,
+        CONF_HISTORY_SIZE: config["history_size"],
+        CONF_METER_CYCLES: config["meter_cycles"],
+        CONF_THRESHOLDS: config["thresholds"],
+    }
+    hass.async_create_task(
+        async_import_yaml(
+            hass,
+            {
+                CONF_USERNAME: config[CONF_USERNAME],
+                CONF_PASSWORD: config[CONF_PASSWORD],
+                CONF_ID: config[CONF_ID],
+                "options": options,
+            },
         )
-
-    coordinator = DataUpdateCoordinator[franklinwh.Stats](
-        hass,
-        _LOGGER,
-        name="franklinwh",
-        update_method=_update_data,
-        update_interval=update_interval,
-        always_update=False,
     )
 
-    # Initial fetch (If we don't kick this off manually, we'll get unavailable
-    # sensors until the first scheduled update).
-    await coordinator.async_refresh()
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensors for a config entry."""
+    options = entry.runtime_data.options
+    coordinator: FranklinCoordinator = entry.runtime_data.coordinator
+    unique_id = entry.data[CONF_ID] if options[CONF_USE_SN] else None
+    prefix: str = options[CONF_PREFIX]
 
     async_add_entities(
         [
@@ -217,12 +160,21 @@ async def async_setup_platform(
             V2LUseSensor(coordinator, prefix, unique_id),
             V2LExportSensor(coordinator, prefix, unique_id),
             V2LImportSensor(coordinator, prefix, unique_id),
+            StateOfChargeRateSensor(coordinator, prefix, unique_id),
+            BatteryTimeToEmptySensor(coordinator, prefix, unique_id),
+            BatteryTimeToFullSensor(coordinator, prefix, unique_id),
+            HomeLoadPeakSensor(coordinator, prefix, unique_id),
+        ]
+        + [
+            PeriodEnergySensor(coordinator, prefix, unique_id, cycle, attr)
+            for cycle in options[CONF_METER_CYCLES]
+            for attr in METER_FIELDS
         ]
     )
 
 
 class FranklinSensor(
-    CoordinatorEntity[DataUpdateCoordinator[franklinwh.Stats]], SensorEntity
+    CoordinatorEntity[FranklinCoordinator], SensorEntity
 ):
     """Base class for FranklinWH sensors."""
 
@@ -596,3 +548,118 @@ class V2LImportSensor(FranklinSensor):
     def native_value(self):
         """Value."""
         return self.coordinator.data.totals.v2l_import
+
+
+class FranklinTrendSensor(FranklinSensor):
+    """Base class for sensors derived from the recent sample history."""
+
+    def soc_rate(self) -> float | None:
+        """Rate of change of the state of charge, in percent per hour."""
+        slope = self.coordinator.history.slope("battery_soc")
+        if slope is None:
+            return None
+        return slope * 3600
+
+
+class StateOfChargeRateSensor(FranklinTrendSensor):
+    """Shows how quickly the state of charge is changing."""
+
+    _attr_native_unit_of_measurement = "%/h"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, coordinator, prefix, unique_id) -> None:
+        """Initializer."""
+        super().__init__(coordinator, prefix, unique_id, "_state_of_charge_rate")
+
+    @property
+    def native_value(self):
+        """Value."""
+        return self.soc_rate()
+
+
+class BatteryTimeToEmptySensor(FranklinTrendSensor):
+    """Shows the estimated time until the battery is empty at the current rate."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator, prefix, unique_id) -> None:
+        """Initializer."""
+        super().__init__(coordinator, prefix, unique_id, "_battery_time_to_empty")
+
+    @property
+    def native_value(self):
+        """Value."""
+        rate = self.soc_rate()
+        soc = self.coordinator.history.latest("battery_soc")
+        if rate is None or soc is None or rate >= 0:
+            return None
+        return soc / -rate * 60
+
+
+class BatteryTimeToFullSensor(FranklinTrendSensor):
+    """Shows the estimated time until the battery is full at the current rate."""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MINUTES
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+
+    def __init__(self, coordinator, prefix, unique_id) -> None:
+        """Initializer."""
+        super().__init__(coordinator, prefix, unique_id, "_battery_time_to_full")
+
+    @property
+    def native_value(self):
+        """Value."""
+        rate = self.soc_rate()
+        soc = self.coordinator.history.latest("battery_soc")
+        if rate is None or soc is None or rate <= 0:
+            return None
+        return (100 - soc) / rate * 60
+
+
+class HomeLoadPeakSensor(FranklinTrendSensor):
+    """Shows the peak home load over the recent sample history."""
+
+    _attr_native_unit_of_measurement = UnitOfPower.KILO_WATT
+    _attr_device_class = SensorDeviceClass.POWER
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, prefix, unique_id) -> None:
+        """Initializer."""
+        super().__init__(coordinator, prefix, unique_id, "_home_load_peak")
+
+    @property
+    def native_value(self):
+        """Value."""
+        return self.coordinator.history.peak("home_load")
+
+
+class PeriodEnergySensor(FranklinSensor):
+    """Shows the energy counted by one of the period meters."""
+
+    _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
+    _attr_device_class = SensorDeviceClass.ENERGY
+    _attr_state_class = SensorStateClass.TOTAL
+
+    def __init__(self, coordinator, prefix, unique_id, cycle, attr) -> None:
+        """Initializer."""
+        super().__init__(
+            coordinator, prefix, unique_id, f"_{METER_FIELDS[attr]}_{cycle}"
+        )
+        self.cycle = cycle
+        self.attr = attr
+
+    @property
+    def native_value(self):
+        """Value."""
+        return self.coordinator.meters.value(self.cycle, self.attr)
+
+    @property
+    def last_reset(self):
+        """Start of the current period."""
+        return self.coordinator.meters.last_reset(self.cycle)
@@ -1,7 +1,5 @@
 #!/usr/bin/env python
 
-import franklinwh
-
 from homeassistant.components.switch import (
     SwitchEntity,
     PLATFORM_SCHEMA as PARENT_PLATFORM_SCHEMA,
@@ -15,18 +13,22 @@ from homeassistant.const import (
         CONF_NAME,
         CONF_SWITCHES,
         )
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import async_import_yaml
+from .const import (
+        CONF_PREFIX,
+        CONF_SWITCH_GROUPS,
+        CONF_USE_SN,
+        )
 
 import logging
 _LOGGER = logging.getLogger(__name__)
-DEFAULT_UPDATE_INTERVAL = 30
 
 PLATFORM_SCHEMA = PARENT_PLATFORM_SCHEMA.extend(
         {
@@ -35,9 +37,19 @@ PLATFORM_SCHEMA = PARENT_PLATFORM_SCHEMA.extend(
             vol.Required(CONF_ID): cv.string,
             vol.Required(CONF_NAME): cv.string,
             vol.Required(CONF_SWITCHES): cv.ensure_list(vol.In([1, 2, 3])),
-            vol.Optional("use_sn", default=False): cv.boolean,
-            vol.Optional("prefix", default=False): cv.string,
-            vol.Optional("update_interval", default=DEFAULT_UPDATE_INTERVAL): cv.time_period,
+            # Still accepted so existing YAML validates, but not imported: the
+            # entry takes these from the sensor block or the options flow.
+            vol.Optional("use_sn"): cv.boolean,
+            vol.Optional("prefix"): cv.string,
+            vol.Optional("update_interval"): cv.time_period,
+            vol.Optional("dedupe_window"): cv.time_period,
+            }
+        )
+
+SWITCH_GROUP_SCHEMA = vol.Schema(
+        {
+            vol.Required(CONF_NAME): cv.string,
+            vol.Required(CONF_SWITCHES): vol.All(cv.ensure_list, [vol.In([1, 2, 3])]),
             }
         )
 
@@ -47,61 +59,55 @@ async def async_setup_platform(
     add_entities: AddEntitiesCallback,
     discovery_info: DiscoveryInfoType | None = None
 ) -> None:
-    """Set up the sensor platform."""
-    username: str = config[CONF_USERNAME]
-    password: str = config[CONF_PASSWORD]
-    gateway: str = config[CONF_ID]
-    name: str = config[CONF_NAME]
-    update_interval: timedelta = config["update_interval"]
-
-    # TODO(richo) why does it string the default value
-    if config["use_sn"] and config["use_sn"] != "False":
-        unique_id = gateway
-    else:
-        unique_id = None
-
-    # TODO(richo) why does it string the default value
-    if config["prefix"] and config["prefix"] != "False":
-        prefix = config["prefix"]
-    else:
-        prefix = "FranklinWH"
-
-
-    switches: list[int] = list(map(lambda x: x-1, config[CONF_SWITCHES]))
-
-    fetcher = franklinwh.TokenFetcher(username, password)
-    client = franklinwh.Client(fetcher, gateway)
-
-    async def _update_data():
-        _LOGGER.debug("Fetching latest switch data from FranklinWH...")
-        try:
-            return await client.get_smart_switch_state()
-
-        except franklinwh.client.DeviceTimeoutException as e:
-            _LOGGER.warning("Error getting data from FranklinWH - Device Timeout: %s", e)
-        except franklinwh.client.GatewayOfflineException as e:
-            _LOGGER.warning("Error getting data from FranklinWH - Gateway Offline %s", e)
-        except franklinwh.client.AccountLockedException as e:
-            _LOGGER.warning("Error getting data from FranklinWH - Account Locked %s", e)
-        except franklinwh.client.InvalidCredentialsException as e:
-            _LOGGER.warning("Error getting data from FranklinWH - Invalid Credentials %s", e)
-
-    # TODO(richo) This should be memoized and shared among instances
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="franklinwh",
-        update_method=_update_data,
-        update_interval=update_interval,
-        always_update=False
-    )
+    """Import a YAML switch platform into a config entry."""
+    _LOGGER.warning(
+            "Configuring FranklinWH switches in YAML is deprecated. Your configuration"
+            " has been imported as a switch group; remove the franklin_wh switch platform"
+            " from configuration.yaml and manage it under Settings -> Devices & Services")
+
+    # Only the group is imported. Entry-wide options come from the sensor
+    # block, so they don't depend on which block happens to be imported first.
+    hass.async_create_task(async_import_yaml(hass, {
+        CONF_USERNAME: config[CONF_USERNAME],
+        CONF_PASSWORD: config[CONF_PASSWORD],
+        CONF_ID: config[CONF_ID],
+        "options": {
+            CONF_SWITCH_GROUPS: [
+                {CONF_NAME: config[CONF_NAME], CONF_SWITCHES: list(config[CONF_SWITCHES])},
+                ],
+            },
+        }))
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the switch groups for a config entry."""
+    options = entry.runtime_data.options
+    coordinator = entry.runtime_data.switch_coordinator
+    client = coordinator.client
+    unique_id = entry.data[CONF_ID] if options[CONF_USE_SN] else None
+    prefix = options[CONF_PREFIX]
+
+    groups = options[CONF_SWITCH_GROUPS]
+    if not groups:
+        return
 
     # Initial fetch (If we don't kick this off manually, we'll get unavailable
     # sensors until the first scheduled update).
     await coordinator.async_refresh()
 
     add_entities([
-        SmartCircuitSwitch(prefix, unique_id, name, switches, client, coordinator),
+        SmartCircuitSwitch(
+            prefix,
+            unique_id,
+            group[CONF_NAME],
+            list(map(lambda x: x-1, group[CONF_SWITCHES])),
+            client,
+            coordinator,
+            )
+        for group in groups
         ])
 
 # Is it chill to have a switch in here? We'll see!
@@ -150,7 +156,8 @@ class SmartCircuitSwitch(CoordinatorEntity, SwitchEntity):
         for i in self.switches:
             switches[i] = True
         await self.client.set_smart_switch_state(switches)
-        await self.coordinator.async_refresh()
+        # Debounced, so toggling several groups at once only reads back once.
+        await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):
         """Turn the switch off."""
@@ -158,4 +165,5 @@ class SmartCircuitSwitch(CoordinatorEntity, SwitchEntity):
         for i in self.switches:
             switches[i] = False
         await self.client.set_smart_switch_state(switches)
-        await self.coordinator.async_refresh()
+        # Debounced, so toggling several groups at once only reads back once.
+        await self.coordinator.async_request_refresh()
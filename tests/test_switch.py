@@ -0,0 +1,65 @@
+"""Tests for the FranklinWH smart circuit switches."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("franklinwh")
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+# pylint: disable=wrong-import-position
+from franklin_wh.client import SingleFlightClient  # noqa: E402
+from franklin_wh.const import DEFAULT_OPTIONS, DOMAIN  # noqa: E402
+from franklin_wh.coordinator import SwitchCoordinator  # noqa: E402
+from franklin_wh.switch import SmartCircuitSwitch  # noqa: E402
+from pytest_homeassistant_custom_component.common import (  # noqa: E402
+    MockConfigEntry,
+)
+
+from homeassistant.const import CONF_ID, CONF_PASSWORD, CONF_USERNAME  # noqa: E402
+from homeassistant.core import HomeAssistant  # noqa: E402
+
+
+class FakeClient:
+    """Stand-in for ``franklinwh.Client`` that counts switch state reads."""
+
+    def __init__(self) -> None:
+        self.state = [False, False, False]
+        self.reads = 0
+
+    async def get_smart_switch_state(self):
+        self.reads += 1
+        await asyncio.sleep(0)
+        return list(self.state)
+
+    async def set_smart_switch_state(self, state) -> None:
+        await asyncio.sleep(0)
+        for i, value in enumerate(state):
+            if value is not None:
+                self.state[i] = value
+
+
+@pytest.mark.asyncio
+async def test_concurrent_toggles_read_state_once(hass: HomeAssistant) -> None:
+    """Toggling two groups at once reads the switch state back only once."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_USERNAME: "user", CONF_PASSWORD: "pass", CONF_ID: "gateway"},
+        options=DEFAULT_OPTIONS,
+    )
+    entry.add_to_hass(hass)
+    fake = FakeClient()
+    client = SingleFlightClient(fake)
+    coordinator = SwitchCoordinator(hass, entry, client, DEFAULT_OPTIONS)
+    await coordinator.async_refresh()
+    fake.reads = 0
+
+    first = SmartCircuitSwitch("FranklinWH", None, "first", [0], client, coordinator)
+    second = SmartCircuitSwitch("FranklinWH", None, "second", [1, 2], client, coordinator)
+    await asyncio.gather(first.async_turn_on(), second.async_turn_on())
+    await hass.async_block_till_done()
+
+    assert fake.state == [True, True, True]
+    assert fake.reads == 1